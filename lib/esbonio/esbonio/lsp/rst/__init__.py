@@ -1,4 +1,5 @@
 import collections
+import functools
 import inspect
 import logging
 import pathlib
@@ -694,6 +695,26 @@ class RstLanguageServer(LanguageServer):
         key = (source, normalise_uri(uri))
         self._diagnostics.setdefault(key, []).append(diagnostic)
 
+    def add_diagnostics_batch(
+        self, source: str, uri: str, diagnostics: List[Diagnostic]
+    ) -> None:
+        """Add a batch of diagnostics to the given source and uri.
+
+        Unlike calling :meth:`add_diagnostics` in a loop, the uri is only normalised
+        once for the whole batch.
+
+        Parameters
+        ----------
+        source
+           The source the diagnostics are from
+        uri
+           The uri the diagnostics are associated with
+        diagnostics
+           The diagnostics to add
+        """
+        key = (source, normalise_uri(uri))
+        self._diagnostics.setdefault(key, []).extend(diagnostics)
+
     def set_diagnostics(
         self, source: str, uri: str, diagnostics: List[Diagnostic]
     ) -> None:
@@ -822,10 +843,21 @@ class RstLanguageServer(LanguageServer):
 
 
 def normalise_uri(uri: str) -> str:
+    return _normalise_uri_cached(uri, IS_WIN)
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalise_uri_cached(uri: str, is_win: bool) -> str:
+    """Do the actual work of normalising a uri.
+
+    A single build can publish diagnostics for the same small set of uris
+    thousands of times, so the result is memoized. ``is_win`` is part of the key
+    so that the cache remains correct when ``IS_WIN`` is patched in tests.
+    """
     uri = Uri.from_fs_path(Uri.to_fs_path(uri))
 
     # Paths on windows are case insensitive.
-    if IS_WIN:
+    if is_win:
         uri = uri.lower()
 
     return uri
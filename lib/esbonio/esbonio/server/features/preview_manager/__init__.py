@@ -1,7 +1,11 @@
 import asyncio
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
 from http.server import HTTPServer
 from http.server import SimpleHTTPRequestHandler
+from http.server import ThreadingHTTPServer
 from typing import Any
 from typing import Optional
 from urllib.parse import urlencode
@@ -19,10 +23,90 @@ from .webview import make_ws_server
 
 
 class RequestHandler(SimpleHTTPRequestHandler):
+    # Use HTTP/1.1 so that the TCP connection can be reused for each of the page's
+    # assets. ``SimpleHTTPRequestHandler`` already sends the ``Content-Length``
+    # header required for this to work.
+    protocol_version = "HTTP/1.1"
+
+    _etag: Optional[str] = None
+
     def __init__(self, *args, logger: logging.Logger, directory: str, **kwargs) -> None:
         self.logger = logger
         super().__init__(*args, directory=directory, **kwargs)
 
+    def send_head(self):
+        """Same as the base implementation, but with support for conditional
+        requests.
+
+        ``sphinx-build`` often rewrites output files with identical contents, so
+        returning a ``304 Not Modified`` wherever possible saves re-sending the
+        entire site each time the preview is reloaded.
+        """
+        self._etag = None
+
+        fpath = self.translate_path(self.path)
+        if os.path.isfile(fpath):
+            try:
+                st = os.stat(fpath)
+            except OSError:
+                st = None
+
+            if st is not None:
+                etag = f'W/"{st.st_size:x}-{st.st_mtime_ns:x}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(HTTPStatus.NOT_MODIFIED)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return None
+
+                self._etag = etag
+
+        return super().send_head()
+
+    def copyfile(self, source, outputfile):
+        """Same as the base implementation, but use ``os.sendfile`` where possible.
+
+        The kernel can then copy the file straight to the socket, skipping the
+        16KB read/write loop (and associated userspace buffering) that
+        ``shutil.copyfileobj`` would use.
+        """
+        if not hasattr(os, "sendfile"):
+            super().copyfile(source, outputfile)
+            return
+
+        try:
+            in_fd = source.fileno()
+            out_fd = outputfile.fileno()
+            size = os.fstat(in_fd).st_size
+        except (AttributeError, OSError):
+            # Not a real file - a generated directory listing, perhaps.
+            super().copyfile(source, outputfile)
+            return
+
+        offset = 0
+        try:
+            while offset < size:
+                sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError:
+            if offset == 0:
+                # Nothing was sent, it's still safe to fall back to a userspace copy.
+                super().copyfile(source, outputfile)
+                return
+            raise
+
+    def end_headers(self) -> None:
+        if self._etag is not None:
+            # Ask the client to revalidate (cheap, thanks to the ETag) rather than
+            # cache, build output can change at any moment.
+            self.send_header("ETag", self._etag)
+            self.send_header("Cache-Control", "no-cache")
+            self._etag = None
+
+        super().end_headers()
+
     def translate_path(self, path: str) -> str:
         result = super().translate_path(path)
         # self.logger.debug("Translate: '%s' -> '%s'", path, result)
@@ -42,15 +126,28 @@ class RequestHandlerFactory:
 
     def __init__(self, logger: logging.Logger, build_uri: Optional[Uri] = None):
         self.logger = logger
+        self.build_dir: Optional[str] = None
         self.build_uri = build_uri
 
+    @property
+    def build_uri(self) -> Optional[Uri]:
+        """The uri of the build directory to serve files from."""
+        return self._build_uri
+
+    @build_uri.setter
+    def build_uri(self, value: Optional[Uri]):
+        # ``__call__`` runs on the http server's threads for every request, so do
+        # the uri -> fs path translation once, here.
+        self._build_uri = value
+        self.build_dir = value.fs_path if value is not None else None
+
     def __call__(self, *args, **kwargs):
-        if self.build_uri is None:
+        if self._build_uri is None:
             raise ValueError("No build directory set")
 
-        if (build_dir := self.build_uri.fs_path) is None:
+        if (build_dir := self.build_dir) is None:
             raise ValueError(
-                "Unable to determine build dir from uri: '%s'", self.build_uri
+                "Unable to determine build dir from uri: '%s'", self._build_uri
             )
 
         return RequestHandler(*args, logger=self.logger, directory=build_dir, **kwargs)
@@ -88,9 +185,17 @@ class PreviewManager(LanguageFeature):
         self._http_server: Optional[HTTPServer] = None
         self._http_future: Optional[asyncio.Future] = None
 
+        # Give the http server its own executor, so that it cannot starve other
+        # features sharing the server's thread pool.
+        self._executor = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="esbonio-preview"
+        )
+
         self._ws_server: Optional[WebviewServer] = None
         self._ws_task: Optional[asyncio.Task] = None
 
+        self._reload_pending: Optional[asyncio.Task] = None
+
     @property
     def preview_active(self) -> bool:
         """Return true if the preview is active.
@@ -126,13 +231,15 @@ class PreviewManager(LanguageFeature):
         if self._http_server is not None:
             return self._http_server
 
-        self._http_server = HTTPServer(
+        # Use a threading server so that a long-lived, keep-alive connection does not
+        # block other asset requests.
+        self._http_server = ThreadingHTTPServer(
             (config.bind, config.http_port), self._request_handler_factory
         )
 
         loop = asyncio.get_running_loop()
         self._http_future = loop.run_in_executor(
-            self.server.thread_pool_executor,
+            self._executor,
             self._http_server.serve_forever,
         )
 
@@ -151,9 +258,22 @@ class PreviewManager(LanguageFeature):
             self._ws_server.start_ws(config.bind, config.ws_port)
         )
 
-        # HACK: we need to yield control to the event loop to give the ws_server time to
-        #       spin up and allocate a port number.
-        await asyncio.sleep(1)
+        # Wait for the ws_server to spin up and allocate a port number, while also
+        # watching for it to fail e.g. because the configured port is already in use.
+        ready = asyncio.create_task(self._ws_server.ready.wait())
+        done, _ = await asyncio.wait(
+            {ready, self._ws_task}, return_when=asyncio.FIRST_COMPLETED
+        )
+
+        if self._ws_task in done:
+            ready.cancel()
+
+            ws_task, self._ws_task = self._ws_task, None
+            self._ws_server = None
+
+            # Surface the reason why the server stopped, if available.
+            ws_task.result()
+            raise RuntimeError("Webview server stopped before it was ready")
 
         return self._ws_server
 
@@ -167,6 +287,20 @@ class PreviewManager(LanguageFeature):
         if client.build_uri != self._request_handler_factory.build_uri:
             return
 
+        # Saving a file can easily trigger several builds in quick succession, only
+        # reload the view once things have settled down.
+        if self._reload_pending is not None:
+            return
+
+        self._reload_pending = asyncio.create_task(self._debounced_reload())
+
+    async def _debounced_reload(self):
+        await asyncio.sleep(0.1)
+        self._reload_pending = None
+
+        if self._ws_server is None:
+            return
+
         self.logger.debug("Refreshing preview")
         self._ws_server.reload()
 
@@ -213,15 +347,20 @@ class PreviewManager(LanguageFeature):
         if config.show_line_markers:
             query_params["show-markers"] = True
 
-        uri = Uri.create(
-            scheme="http",
-            authority=f"localhost:{server.server_port}",
-            path=build_path,
-            query=urlencode(query_params),
+        # ``build_path`` comes from the build output of a trusted Sphinx instance, so
+        # there is no need to run it through the full encoding logic in ``Uri``.
+        assert "?" not in build_path and "#" not in build_path
+
+        if not build_path.startswith("/"):
+            build_path = f"/{build_path}"
+
+        uri = (
+            f"http://localhost:{server.server_port}{build_path}"
+            f"?{urlencode(query_params)}"
         )
 
-        self.logger.info("Preview available at: %s", uri.as_string(encode=False))
-        return {"uri": uri.as_string(encode=False)}
+        self.logger.info("Preview available at: %s", uri)
+        return {"uri": uri}
 
 
 def esbonio_setup(server: EsbonioLanguageServer, sphinx: SphinxManager):
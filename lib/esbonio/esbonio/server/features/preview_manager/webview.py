@@ -29,6 +29,10 @@ class WebviewServer(Server):
         self.lsp._send_only_body = True
         self.port = None
 
+        self.ready = asyncio.Event()
+        """Set once the server has bound to a port and is able to accept
+        connections."""
+
         self._connected = False
         self._editor_in_control: Optional[asyncio.Task] = None
         self._view_in_control: Optional[asyncio.Task] = None
@@ -94,6 +98,7 @@ class WebviewServer(Server):
         ) as ws_server:
             sock = list(ws_server.sockets)[0]
             self.port = sock.getsockname()[1]
+            self.ready.set()
             await asyncio.Future()  # run forever
 
 
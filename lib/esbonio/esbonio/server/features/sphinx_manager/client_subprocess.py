@@ -2,12 +2,14 @@
 from __future__ import annotations
 
 import asyncio
+import collections
 import json
 import logging
 import os
 import sys
 import typing
 from typing import Any
+from typing import Deque
 from typing import Dict
 from typing import List
 from typing import Optional
@@ -54,10 +56,17 @@ class SubprocessSphinxClient(JsonRPCClient):
         self.logger = logger or logging.getLogger(__name__)
 
         self.sphinx_info: Optional[types.SphinxInfo] = None
+        self._src_uri: Optional[Uri] = None
+        self._conf_uri: Optional[Uri] = None
+        self._build_uri: Optional[Uri] = None
+
         self._building = False
         self._build_file_map: Dict[Uri, str] = {}
         self._diagnostics: Dict[Uri, List[types.Diagnostic]] = {}
 
+        self._stderr_tail: Deque[bytes] = collections.deque(maxlen=200)
+        self._stderr_task: Optional[asyncio.Task] = None
+
     @property
     def id(self) -> Optional[str]:
         """The id of the Sphinx instance."""
@@ -81,18 +90,12 @@ class SubprocessSphinxClient(JsonRPCClient):
     @property
     def src_uri(self) -> Optional[Uri]:
         """The src uri of the Sphinx application."""
-        if self.sphinx_info is None:
-            return None
-
-        return Uri.for_file(self.sphinx_info.src_dir)
+        return self._src_uri
 
     @property
     def conf_uri(self) -> Optional[Uri]:
         """The conf uri of the Sphinx application."""
-        if self.sphinx_info is None:
-            return None
-
-        return Uri.for_file(self.sphinx_info.conf_dir)
+        return self._conf_uri
 
     @property
     def diagnostics(self) -> Dict[str, List[types.Diagnostic]]:
@@ -110,10 +113,17 @@ class SubprocessSphinxClient(JsonRPCClient):
     @property
     def build_uri(self) -> Optional[Uri]:
         """The build uri of the Sphinx application."""
-        if self.sphinx_info is None:
-            return None
+        return self._build_uri
+
+    async def _drain_stderr(self, stderr: asyncio.StreamReader):
+        """Continuously read the agent's stderr.
 
-        return Uri.for_file(self.sphinx_info.build_dir)
+        If stderr were only read once the process had exited, a chatty agent could
+        fill the pipe's buffer and deadlock, blocked on a write that will never be
+        read. Keep the pipe drained, holding onto just the most recent output.
+        """
+        while line := await stderr.readline():
+            self._stderr_tail.append(line)
 
     async def server_exit(self, server: asyncio.subprocess.Process):
         """Called when the sphinx agent process exits."""
@@ -125,8 +135,13 @@ class SubprocessSphinxClient(JsonRPCClient):
                 f"sphinx-agent process exited with code: {server.returncode}"
             )
 
-            if server.stderr is not None:
-                stderr = await server.stderr.read()
+            # Wait for the drain task to consume any final buffered output - the
+            # process has exited, so it is guaranteed to reach EOF.
+            if self._stderr_task is not None:
+                await self._stderr_task
+
+            if len(self._stderr_tail) > 0:
+                stderr = b"".join(self._stderr_tail)
                 self.logger.error("Stderr:\n%s", stderr.decode("utf8"))
 
         # TODO: Should the upstream base client be doing this?
@@ -151,6 +166,11 @@ class SubprocessSphinxClient(JsonRPCClient):
 
         await self.start_io(*command, env=env, cwd=config.cwd)
 
+        if self._server is not None and self._server.stderr is not None:
+            self._stderr_task = asyncio.create_task(
+                self._drain_stderr(self._server.stderr)
+            )
+
     async def stop(self):
         """Stop the client."""
         self.protocol.notify("exit", None)
@@ -169,6 +189,13 @@ class SubprocessSphinxClient(JsonRPCClient):
 
         sphinx_info = await self.protocol.send_request_async("sphinx/createApp", params)
         self.sphinx_info = sphinx_info
+
+        # These uris are immutable once the application is created, but are read on
+        # every build and preview event - so compute them once, here.
+        self._src_uri = Uri.for_file(sphinx_info.src_dir)
+        self._conf_uri = Uri.for_file(sphinx_info.conf_dir)
+        self._build_uri = Uri.for_file(sphinx_info.build_dir)
+
         return sphinx_info
 
     async def build(
@@ -1,3 +1,4 @@
+import functools
 import hashlib
 import importlib.util
 import logging
@@ -12,9 +13,13 @@ from pygls.workspace import Workspace
 from esbonio.server import Uri
 
 
+@functools.lru_cache(maxsize=None)
 def get_module_path(module: str) -> Optional[pathlib.Path]:
     """Return the path to the directory containing the given module name.
 
+    The result is cached, ``importlib.util.find_spec`` walks ``sys.path`` on
+    every call and the answer will not change over the lifetime of the server.
+
     Parameters
     ----------
     module
@@ -141,9 +146,13 @@ class SphinxConfig:
         if self.cwd:
             return self.cwd
 
-        for folder_uri in workspace.folders.keys():
-            folder_uri = Uri.parse(folder_uri)
-            if folder_uri and str(uri).startswith(str(folder_uri)):
+        uri_str = str(uri)
+
+        # Check the most specific folders first, so that the longest matching prefix
+        # wins when workspace folders are nested.
+        for folder in sorted(workspace.folders.keys(), key=len, reverse=True):
+            folder_uri = Uri.parse(folder)
+            if folder_uri and uri_str.startswith(str(folder_uri)):
                 break
         else:
             folder_uri = Uri.parse(workspace.root_uri)
@@ -234,7 +243,9 @@ class SphinxConfig:
             logger.debug("Trying path: %s", current)
             if conf_py.exists():
                 cache = platformdirs.user_cache_dir("esbonio", "swyddfa")
-                project = hashlib.md5(str(current).encode()).hexdigest()
+                project = hashlib.blake2b(
+                    str(current).encode(), digest_size=8
+                ).hexdigest()
                 build_dir = str(pathlib.Path(cache, project))
                 return ["sphinx-build", "-M", "dirhtml", str(current), str(build_dir)]
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import collections
+import functools
 import inspect
 import json
 import logging
@@ -10,6 +11,7 @@ from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Set
 from typing import Tuple
 from typing import Type
 from typing import TypeVar
@@ -306,17 +308,46 @@ class EsbonioLanguageServer(LanguageServer):
     def sync_diagnostics(self) -> None:
         """Update the client with the currently stored diagnostics."""
 
-        uris = {uri for _, uri in self._diagnostics.keys()}
-        diagnostics = {uri: DiagnosticList() for uri in uris}
+        by_uri: Dict[Uri, List[types.Diagnostic]] = {}
+        seen: Dict[Uri, Set[Tuple]] = {}
 
         for (source, uri), diags in self._diagnostics.items():
+            bucket = by_uri.setdefault(uri, [])
+            keys = seen.setdefault(uri, set())
+
             for diag in diags:
                 diag.source = source
-                diagnostics[uri].append(diag)
 
-        for uri, diag_list in diagnostics.items():
-            self.logger.debug("Publishing %d diagnostics for: %s", len(diag_list), uri)
-            self.publish_diagnostics(str(uri), diag_list.data)
+                key = _diagnostic_key(diag)
+                if key in keys:
+                    continue
+
+                keys.add(key)
+                bucket.append(diag)
+
+        for uri, diagnostics in by_uri.items():
+            self.logger.debug(
+                "Publishing %d diagnostics for: %s", len(diagnostics), uri
+            )
+            self.publish_diagnostics(str(uri), diagnostics)
+
+
+def _diagnostic_key(item: types.Diagnostic) -> Tuple:
+    """Return a hashable key identifying the given diagnostic, used to detect
+    duplicates.
+
+    ``Range`` objects are not hashable, so their fields are used instead.
+    """
+    return (
+        item.range.start.line,
+        item.range.start.character,
+        item.range.end.line,
+        item.range.end.character,
+        item.message,
+        item.severity,
+        item.code,
+        item.source,
+    )
 
 
 class DiagnosticList(collections.UserList):
@@ -326,40 +357,55 @@ class DiagnosticList(collections.UserList):
     reported.
     """
 
+    def __init__(self, initlist=None):
+        super().__init__()
+
+        self._seen: Set[Tuple] = set()
+        """The keys of the diagnostics added so far, so that duplicates can be
+        detected in constant time."""
+
+        for item in initlist or []:
+            self.append(item)
+
     def append(self, item: types.Diagnostic):
         if not isinstance(item, types.Diagnostic):
             raise TypeError("Expected Diagnostic")
 
-        for existing in self.data:
-            fields = [
-                existing.range == item.range,
-                existing.message == item.message,
-                existing.severity == item.severity,
-                existing.code == item.code,
-                existing.source == item.source,
-            ]
-
-            if all(fields):
-                # Item already added, nothing to do.
-                return
+        key = _diagnostic_key(item)
+        if key in self._seen:
+            # Item already added, nothing to do.
+            return
 
+        self._seen.add(key)
         self.data.append(item)
 
 
+@functools.lru_cache(maxsize=None)
+def _param_types(setup: Callable) -> Tuple[Tuple[str, Any], ...]:
+    """Return the name and type of each of the given setup function's parameters.
+
+    Resolving type hints and inspecting signatures is expensive and the answer
+    for a given function never changes, so results are cached.
+    """
+    annotations = getattr(setup, "__annotations__", {})
+    if any(isinstance(v, str) for v in annotations.values()):
+        # Only forward references need the full resolution machinery.
+        annotations = typing.get_type_hints(setup)
+
+    return tuple(
+        (p.name, annotations[p.name])
+        for p in inspect.signature(setup).parameters.values()
+    )
+
+
 def _get_setup_arguments(
     server: EsbonioLanguageServer, setup: Callable, modname: str
 ) -> Optional[Dict[str, Any]]:
     """Given a setup function, try to construct the collection of arguments to pass to
     it.
     """
-    annotations = typing.get_type_hints(setup)
-    parameters = {
-        p.name: annotations[p.name]
-        for p in inspect.signature(setup).parameters.values()
-    }
-
     args = {}
-    for name, type_ in parameters.items():
+    for name, type_ in _param_types(setup):
         if issubclass(server.__class__, type_):
             args[name] = server
             continue
@@ -241,13 +241,12 @@ def _build_file_mapping(app: Sphinx) -> Dict[str, str]:
     # Don't forget any included files.
     # TODO: How best to handle files included in multiple documents?
     for parent_doc, included_docs in env.included.items():
+        target_uri = mapping[env.doc2path(parent_doc)]
         for doc in included_docs:
-            mapping[env.doc2path(doc)] = mapping[env.doc2path(parent_doc)]
+            mapping[env.doc2path(doc)] = target_uri
 
     # Ensure any relative paths in included docs are resolved.
-    mapping = {str(pathlib.Path(d).resolve()): uri for d, uri in mapping.items()}
-
-    return mapping
+    return {str(pathlib.Path(d).resolve()): uri for d, uri in mapping.items()}
 
 
 def _enable_sync_scrolling(app: Sphinx):